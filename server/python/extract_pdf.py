@@ -11,21 +11,190 @@ import os
 import traceback
 from io import BytesIO
 import base64
+import hashlib
+import tempfile
+import time
+import bisect
+import importlib.util
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import namedtuple
+from functools import lru_cache
 
-# Primary extraction library
+# Primary extraction library (C-backed MuPDF engine, much faster than pure-Python parsers)
+HAVE_PYMUPDF = False
+try:
+    import fitz  # PyMuPDF
+    HAVE_PYMUPDF = True
+except ImportError:
+    pass
+
+# Fallback extraction library
 from pypdf import PdfReader
 
-# Backup extraction libraries (if available)
-HAVE_PDFMINER = False
+# Backup extraction libraries (if available). pdfminer has a large import
+# graph, so it is only imported when it is actually needed.
+HAVE_PDFMINER = importlib.util.find_spec('pdfminer') is not None
+
+# Optional multi-pattern regex engine used to pre-scan for date ranges
+HAVE_HYPERSCAN = False
 try:
-    from pdfminer.high_level import extract_text
-    from pdfminer.layout import LAParams
-    HAVE_PDFMINER = True
+    import hyperscan
+    HAVE_HYPERSCAN = True
 except ImportError:
     pass
 
-def extract_from_pdf(pdf_path=None, pdf_data=None):
-    """Extract text from a PDF file using multiple methods for reliability."""
+# Optional C-backed Aho-Corasick automaton for multi-keyword substring scans
+HAVE_AHOCORASICK = False
+try:
+    import ahocorasick
+    HAVE_AHOCORASICK = True
+except ImportError:
+    pass
+
+# pypdf output at least this long, with a sane share of spaces (binary garbage
+# has almost none), is trusted without also running the much slower pdfminer
+MIN_GOOD_TEXT_LENGTH = 500
+MIN_GOOD_SPACE_RATIO = 0.05
+
+def is_good_extraction(text):
+    """Return True if extracted text looks complete enough to skip further extractors."""
+    if len(text) < MIN_GOOD_TEXT_LENGTH:
+        return False
+    return text.count(' ') / len(text) > MIN_GOOD_SPACE_RATIO
+
+# Minimum page count before per-page extraction is spread across processes;
+# short CVs are faster to parse inline than to pay the worker startup cost
+PARALLEL_PAGE_THRESHOLD = 4
+MAX_PAGE_WORKERS = 4
+# Worker processes actually used; with fewer than two the pool is skipped,
+# since a single worker only adds startup cost
+PAGE_WORKERS = min(os.cpu_count() or 1, MAX_PAGE_WORKERS)
+
+# PdfReader opened once per worker process by _init_page_worker
+_worker_reader = None
+
+def _extract_page_text(reader, page_index):
+    """Extract text from one page, returning (page_index, text, error)."""
+    try:
+        return page_index, reader.pages[page_index].extract_text(), None
+    except Exception as e:
+        return page_index, None, str(e)
+
+def _init_page_worker(pdf_bytes):
+    """Open the PDF once in each worker process."""
+    global _worker_reader
+    _worker_reader = PdfReader(BytesIO(pdf_bytes))
+
+def _extract_page(page_index):
+    """Worker entry point: extract a single page from the worker's PDF."""
+    return _extract_page_text(_worker_reader, page_index)
+
+def extract_pages_parallel(pdf_bytes, num_pages):
+    """Extract all pages across a process pool, returning results in page order."""
+    with ProcessPoolExecutor(max_workers=PAGE_WORKERS,
+                             initializer=_init_page_worker,
+                             initargs=(pdf_bytes,)) as executor:
+        return list(executor.map(_extract_page, range(num_pages)))
+
+# On-disk cache of extraction results keyed by a fingerprint of the PDF content
+# and of this module's source, so editing the extractors invalidates old
+# results. Bump CACHE_VERSION whenever extraction results change for another
+# reason (e.g. an upgraded PDF library).
+CACHE_VERSION = 1
+CACHE_DIR = os.environ.get('CVPANDA_CACHE_DIR',
+                           os.path.join(os.path.expanduser('~'), '.cvpanda_cache'))
+# Results hold the full CV text and personal details, so the cache directory is
+# private to the user and pruned on every write: entries older than
+# CACHE_MAX_AGE_DAYS are removed and at most CACHE_MAX_ENTRIES are kept.
+CACHE_MAX_AGE_DAYS = 30
+CACHE_MAX_ENTRIES = 500
+
+def _source_digest():
+    """Return a digest of this module's source, or b'' if it cannot be read."""
+    try:
+        with open(__file__, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=16).digest()
+    except OSError:
+        return b''
+
+_SOURCE_DIGEST = _source_digest()
+
+def _cache_path(pdf_bytes):
+    """Return the cache file path for the given PDF content."""
+    key = hashlib.blake2b(pdf_bytes, digest_size=16, key=_SOURCE_DIGEST).hexdigest()
+    return os.path.join(CACHE_DIR, f"v{CACHE_VERSION}", f"{key}.json")
+
+def load_cached_result(cache_path):
+    """Return a previously cached extraction result, or None on a miss."""
+    try:
+        if os.path.getmtime(cache_path) < time.time() - CACHE_MAX_AGE_DAYS * 86400:
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_cached_result(cache_path, result):
+    """Atomically write an extraction result to the cache."""
+    tmp_path = None
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        # mkstemp creates the file readable by the owner only
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        print(f"Failed to write extraction cache: {str(e)}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        return
+    prune_cache(cache_dir)
+
+def prune_cache(cache_dir):
+    """Remove expired cache entries, then the oldest beyond CACHE_MAX_ENTRIES."""
+    cutoff = time.time() - CACHE_MAX_AGE_DAYS * 86400
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(entry.stat().st_mtime, entry.path) for entry in it
+                       if entry.name.endswith('.json')]
+    except OSError as e:
+        print(f"Failed to prune extraction cache: {str(e)}")
+        return
+    
+    # Newest first, so everything past CACHE_MAX_ENTRIES is the oldest
+    entries.sort(reverse=True)
+    for i, (mtime, path) in enumerate(entries):
+        if i >= CACHE_MAX_ENTRIES or mtime < cutoff:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+# Base64 text only uses this alphabet; raw PDF data ("%PDF-...") never matches
+_B64_RE = re.compile(r'^[A-Za-z0-9+/=\s]+$')
+
+def decode_pdf_data(pdf_data):
+    """Return PDF data as bytes, decoding it first if it is a base64 string."""
+    if not isinstance(pdf_data, str):
+        return pdf_data
+    if _B64_RE.match(pdf_data[:64]):
+        try:
+            return base64.b64decode(pdf_data)
+        except Exception as e:
+            print(f"Failed to decode base64 data: {e}")
+    return pdf_data.encode('utf-8')
+
+def extract_pdf_text(pdf_path=None, pdf_data=None, use_cache=True):
+    """Run the text extraction stage of extract_from_pdf.
+    
+    Returns a (result, extraction, cache_path) tuple. result is set when no
+    further work is needed (a cached result or an error); otherwise extraction
+    holds the best extractor's 'text' (and 'pages') for analyze_text().
+    """
     try:
         print(f"Starting PDF extraction from {'file' if pdf_path else 'data'}")
         
@@ -38,94 +207,134 @@ def extract_from_pdf(pdf_path=None, pdf_data=None):
                     "full_text": "",
                     "sections": {},
                     "structured_data": {}
-                }
+                }, None, None
             
-            # Check if file is readable
+            # Read the whole file once; every extractor below works on these bytes
             try:
                 with open(pdf_path, 'rb') as f:
-                    # Just checking if we can read
-                    file_data = f.read(10)
+                    pdf_data = f.read()
             except Exception as e:
                 return {
                     "error": f"Cannot read PDF file: {str(e)}",
                     "full_text": "",
                     "sections": {},
                     "structured_data": {}
-                }
+                }, None, None
+        
+        # Decode base64 data once, up front, for all extractors
+        pdf_data = decode_pdf_data(pdf_data)
+        
+        # Return the cached result if this exact PDF was already processed
+        cache_path = None
+        if use_cache and pdf_data:
+            cache_path = _cache_path(pdf_data)
+            cached_result = load_cached_result(cache_path)
+            if cached_result is not None:
+                print(f"Using cached extraction result: {cache_path}")
+                return cached_result, None, None
         
         # Store all extracted texts for comparison
         extraction_results = {}
         
-        # METHOD 1: PyPDF extraction (most reliable for modern PDFs)
-        try:
-            print("Attempting extraction with PyPDF...")
-            
-            if pdf_path:
-                reader = PdfReader(pdf_path)
-            else:
-                # Decode base64 if needed
-                if isinstance(pdf_data, str):
-                    try:
-                        pdf_data = base64.b64decode(pdf_data)
-                    except Exception as e:
-                        print(f"Failed to decode base64 data: {e}")
-                        pdf_data = pdf_data.encode('utf-8')
+        # METHOD 1: PyMuPDF extraction (fastest, handles most modern PDFs)
+        if HAVE_PYMUPDF:
+            try:
+                print("Attempting extraction with PyMuPDF...")
+                
+                doc = fitz.open(stream=pdf_data, filetype="pdf")
+                
+                print(f"PDF has {len(doc)} pages")
+                
+                page_texts = []
+                try:
+                    for i, page in enumerate(doc):
+                        page_text = page.get_text("text")
+                        if page_text and page_text.strip():
+                            page_texts.append(page_text)
+                            print(f"Page {i+1}: Extracted {len(page_text)} characters")
+                        else:
+                            print(f"Page {i+1}: No text extracted")
+                finally:
+                    doc.close()
+                
+                pymupdf_text = '\n\n'.join(page_texts)
+                print(f"PyMuPDF extracted {len(pymupdf_text)} characters total")
                 
+                extraction_results['pymupdf'] = {
+                    'text': pymupdf_text,
+                    'pages': page_texts,
+                    'length': len(pymupdf_text)
+                }
+            except Exception as e:
+                print(f"PyMuPDF extraction failed: {str(e)}")
+                extraction_results['pymupdf'] = {
+                    'text': '',
+                    'error': str(e),
+                    'length': 0
+                }
+        
+        # Only fall back to the slower pure-Python extractors if PyMuPDF is
+        # unavailable or did not produce any text
+        need_fallback = extraction_results.get('pymupdf', {}).get('length', 0) == 0
+        
+        # METHOD 2: PyPDF extraction (reliable fallback for modern PDFs)
+        if need_fallback:
+            try:
+                print("Attempting extraction with PyPDF...")
+            
                 reader = PdfReader(BytesIO(pdf_data))
             
-            # Get total number of pages
-            num_pages = len(reader.pages)
-            print(f"PDF has {num_pages} pages")
+                # Get total number of pages
+                num_pages = len(reader.pages)
+                print(f"PDF has {num_pages} pages")
             
-            # Extract text from each page
-            all_text = []
-            page_texts = []
+                # Extract text from each page
+                page_texts = []
             
-            for i, page in enumerate(reader.pages):
-                try:
-                    page_text = page.extract_text()
-                    if page_text and page_text.strip():
-                        all_text.append(page_text)
+                page_results = None
+                if num_pages >= PARALLEL_PAGE_THRESHOLD and PAGE_WORKERS >= 2:
+                    try:
+                        page_results = extract_pages_parallel(pdf_data, num_pages)
+                    except Exception as e:
+                        print(f"Parallel page extraction failed, extracting sequentially: {str(e)}")
+                
+                if page_results is None:
+                    page_results = [_extract_page_text(reader, i) for i in range(num_pages)]
+            
+                for i, page_text, error in page_results:
+                    if error:
+                        print(f"Error extracting text from page {i+1}: {error}")
+                    elif page_text and page_text.strip():
                         page_texts.append(page_text)
                         print(f"Page {i+1}: Extracted {len(page_text)} characters")
                     else:
                         print(f"Page {i+1}: No text extracted")
-                except Exception as e:
-                    print(f"Error extracting text from page {i+1}: {str(e)}")
             
-            pypdf_text = '\n\n'.join(all_text)
-            print(f"PyPDF extracted {len(pypdf_text)} characters total")
+                pypdf_text = '\n\n'.join(page_texts)
+                print(f"PyPDF extracted {len(pypdf_text)} characters total")
             
-            extraction_results['pypdf'] = {
-                'text': pypdf_text,
-                'pages': page_texts,
-                'length': len(pypdf_text)
-            }
-        except Exception as e:
-            print(f"PyPDF extraction failed: {str(e)}")
-            extraction_results['pypdf'] = {
-                'text': '',
-                'error': str(e),
-                'length': 0
-            }
+                extraction_results['pypdf'] = {
+                    'text': pypdf_text,
+                    'pages': page_texts,
+                    'length': len(pypdf_text)
+                }
+            except Exception as e:
+                print(f"PyPDF extraction failed: {str(e)}")
+                extraction_results['pypdf'] = {
+                    'text': '',
+                    'error': str(e),
+                    'length': 0
+                }
         
-        # METHOD 2: PDFMiner extraction (if available)
-        if HAVE_PDFMINER:
+        # METHOD 3: PDFMiner extraction (if available and pypdf fell short)
+        pypdf_good = is_good_extraction(extraction_results.get('pypdf', {}).get('text', ''))
+        if HAVE_PDFMINER and need_fallback and not pypdf_good:
             try:
                 print("Attempting extraction with PDFMiner...")
+                from pdfminer.high_level import extract_text
                 
-                if pdf_path:
-                    pdfminer_text = extract_text(pdf_path)
-                else:
-                    # For data, we need to create a BytesIO object
-                    if isinstance(pdf_data, str):
-                        try:
-                            pdf_data = base64.b64decode(pdf_data)
-                        except:
-                            pdf_data = pdf_data.encode('utf-8')
-                    
-                    pdf_stream = BytesIO(pdf_data)
-                    pdfminer_text = extract_text(pdf_stream)
+                pdf_stream = BytesIO(pdf_data)
+                pdfminer_text = extract_text(pdf_stream)
                 
                 print(f"PDFMiner extracted {len(pdfminer_text)} characters")
                 
@@ -151,7 +360,7 @@ def extract_from_pdf(pdf_path=None, pdf_data=None):
                 "full_text": "",
                 "sections": {},
                 "structured_data": {}
-            }
+            }, None, None
         
         # Select the extraction with the most text
         best_method = max(valid_extractions.items(), key=lambda x: x[1]['length'])
@@ -160,68 +369,160 @@ def extract_from_pdf(pdf_path=None, pdf_data=None):
         text = extraction['text']
         print(f"Selected {method_name} extraction with {len(text)} characters")
         
-        # Extract structured information
-        structured_data = extract_structured_info(text)
-        
-        # For PyPDF extraction, we already have page-based sections
-        sections = {"content": text}
-        if method_name == 'pypdf' and 'pages' in extraction:
-            for i, page_text in enumerate(extraction['pages']):
-                sections[f"page_{i+1}"] = page_text
-        
-        # Try to identify proper sections
-        identified_sections = identify_sections(text)
-        sections.update(identified_sections)
-        
-        result = {
-            "full_text": text,
-            "sections": sections,
-            "structured_data": structured_data
-        }
-        
+        return None, extraction, cache_path
+    
+    except Exception as e:
+        return _extraction_error(e), None, None
+
+def _extraction_error(e):
+    """Build the error result for an unexpected exception."""
+    traceback_str = traceback.format_exc()
+    print(f"Extraction error: {str(e)}\n{traceback_str}", file=sys.stderr)
+    return {
+        "error": f"Extraction failed: {str(e)}\n{traceback_str}",
+        "full_text": "",
+        "sections": {},
+        "structured_data": {}
+    }
+
+def analyze_text(text, pages=None):
+    """Build the final extraction result (sections and structured data) from extracted text."""
+    # Extract structured information
+    structured_data = extract_structured_info(text)
+    
+    # For page-aware extractors, we already have page-based sections
+    sections = {"content": text}
+    for i, page_text in enumerate(pages or []):
+        sections[f"page_{i+1}"] = page_text
+    
+    # Add the identified sections (already computed by extract_structured_info)
+    sections.update(structured_data['sections'])
+    
+    return {
+        "full_text": text,
+        "sections": sections,
+        "structured_data": structured_data
+    }
+
+def extract_from_pdf(pdf_path=None, pdf_data=None, use_cache=True):
+    """Extract text from a PDF file using multiple methods for reliability."""
+    result, extraction, cache_path = extract_pdf_text(pdf_path, pdf_data, use_cache)
+    if result is not None:
         return result
     
+    try:
+        result = analyze_text(extraction['text'], extraction.get('pages'))
     except Exception as e:
-        traceback_str = traceback.format_exc()
-        print(f"Extraction error: {str(e)}\n{traceback_str}", file=sys.stderr)
-        return {
-            "error": f"Extraction failed: {str(e)}\n{traceback_str}",
-            "full_text": "",
-            "sections": {},
-            "structured_data": {}
-        }
+        return _extraction_error(e)
+    
+    if cache_path:
+        save_cached_result(cache_path, result)
+    
+    return result
+
+# The extraction stage runs on this single thread, one file at a time: PyMuPDF
+# is not thread-safe, and the pypdf page pool must not be forked from several
+# threads at once
+_EXTRACTION_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pdf-extract')
+
+# Most files extract_many keeps in flight (extracted but not yet analyzed)
+MAX_FILES_IN_FLIGHT = 4
+
+async def extract_from_pdf_async(pdf_path=None, pdf_data=None, use_cache=True, executor=None):
+    """Async version of extract_from_pdf.
+    
+    Text extraction runs on a dedicated extraction thread and the regex-heavy
+    analysis in `executor` (e.g. a ProcessPoolExecutor), so that when several
+    PDFs are processed together one file's analysis overlaps the next file's
+    extraction.
+    """
+    loop = asyncio.get_running_loop()
+    result, extraction, cache_path = await loop.run_in_executor(
+        _EXTRACTION_EXECUTOR, extract_pdf_text, pdf_path, pdf_data, use_cache)
+    if result is not None:
+        return result
+    
+    try:
+        result = await loop.run_in_executor(
+            executor, analyze_text, extraction['text'], extraction.get('pages'))
+    except Exception as e:
+        return _extraction_error(e)
+    
+    if cache_path:
+        save_cached_result(cache_path, result)
+    
+    return result
+
+def extract_many(pdf_paths, use_cache=True):
+    """Extract several PDF files, pipelining extraction and analysis across them.
+    
+    Returns the results in the same order as pdf_paths.
+    """
+    async def run_all():
+        in_flight = asyncio.Semaphore(MAX_FILES_IN_FLIGHT)
+        
+        async def run_one(pdf_path, executor):
+            async with in_flight:
+                return await extract_from_pdf_async(pdf_path=pdf_path, use_cache=use_cache,
+                                                    executor=executor)
+        
+        with ProcessPoolExecutor() as executor:
+            return await asyncio.gather(*(run_one(pdf_path, executor) for pdf_path in pdf_paths))
+    return asyncio.run(run_all())
+
+# Section heading patterns (matched case insensitive)
+SECTION_PATTERNS = {
+    'summary': r'(?:Summary|Profile|About|Objective|Professional\s+Summary|Resumen|Perfil|Objetivo|Acerca\s+de)(?:\s+[A-Za-z]+){0,3}',
+    'experience': r'(?:Experience|Work\s+Experience|Employment|Employment\s+History|Professional\s+Experience|Career|Experiencia|Experiencia\s+Laboral|Empleo|Historial\s+de\s+Empleo|Experiencia\s+Profesional|Trayectoria|Trabajo)',
+    'education': r'(?:Education|Educational\s+Background|Academic|Academics|Qualifications|Degrees|Educación|Formación\s+Académica|Estudios|Títulos)',
+    'skills': r'(?:Skills|Abilities|Competencies|Technical\s+Skills|Core\s+Competencies|Qualifications|Habilidades|Competencias|Capacidades|Aptitudes|Conocimientos)',
+    'certifications': r'(?:Certifications|Certificates|Credentials|Certificaciones|Certificados|Credenciales)',
+    'languages': r'(?:Languages|Language\s+Skills|Idiomas|Competencias\s+Lingüísticas)',
+    'projects': r'(?:Projects|Key\s+Projects|Significant\s+Projects|Project\s+Experience|Proyectos|Proyectos\s+Clave|Proyectos\s+Significativos)',
+    'interests': r'(?:Interests|Hobbies|Activities|Personal\s+Interests|Intereses|Pasatiempos|Actividades|Intereses\s+Personales)',
+    'references': r'(?:References|Referees|Professional\s+References|Referencias|Árbitros|Referencias\s+Profesionales)',
+    'publications': r'(?:Publications|Published\s+Works|Papers|Publicaciones|Trabajos\s+Publicados|Artículos)',
+    'awards': r'(?:Awards|Honors|Achievements|Recognitions|Premios|Honores|Logros|Reconocimientos)',
+    'volunteering': r'(?:Volunteering|Volunteer\s+Experience|Community\s+Service|Voluntariado|Experiencia\s+de\s+Voluntariado|Servicio\s+Comunitario)',
+}
+
+# All section headings fused into one alternation so the text is scanned once.
+# A heading starts the text or a line and is followed by a colon or a line
+# break; the preceding newline is only looked at (not consumed) so that
+# back-to-back heading lines are all found. The named group that matched
+# tells which section type the heading belongs to (the first type listed in
+# SECTION_PATTERNS wins when a heading fits several, e.g. "Qualifications").
+_FUSED_SECTION_RE = re.compile(
+    r'(?:\A|(?<=\n)\s*)(?:'
+    + '|'.join(f'(?P<{section_type}>{pattern})' for section_type, pattern in SECTION_PATTERNS.items())
+    + r')(?:\s*:|\s*\n)',
+    re.IGNORECASE
+)
+
+# CVs rarely have more headings than this; stopping here keeps body text that
+# happens to start lines with section keywords from fragmenting long CVs
+MAX_SECTION_HEADINGS = 20
 
 def identify_sections(text):
     """Identify different sections in the CV."""
     sections = {}
     
-    # Define section patterns (case insensitive)
-    section_patterns = {
-        'summary': r'(?:Summary|Profile|About|Objective|Professional\s+Summary|Resumen|Perfil|Objetivo|Acerca\s+de)(?:\s+[A-Za-z]+){0,3}',
-        'experience': r'(?:Experience|Work\s+Experience|Employment|Employment\s+History|Professional\s+Experience|Career|Experiencia|Experiencia\s+Laboral|Empleo|Historial\s+de\s+Empleo|Experiencia\s+Profesional|Trayectoria|Trabajo)',
-        'education': r'(?:Education|Educational\s+Background|Academic|Academics|Qualifications|Degrees|Educación|Formación\s+Académica|Estudios|Títulos)',
-        'skills': r'(?:Skills|Abilities|Competencies|Technical\s+Skills|Core\s+Competencies|Qualifications|Habilidades|Competencias|Capacidades|Aptitudes|Conocimientos)',
-        'certifications': r'(?:Certifications|Certificates|Credentials|Certificaciones|Certificados|Credenciales)',
-        'languages': r'(?:Languages|Language\s+Skills|Idiomas|Competencias\s+Lingüísticas)',
-        'projects': r'(?:Projects|Key\s+Projects|Significant\s+Projects|Project\s+Experience|Proyectos|Proyectos\s+Clave|Proyectos\s+Significativos)',
-        'interests': r'(?:Interests|Hobbies|Activities|Personal\s+Interests|Intereses|Pasatiempos|Actividades|Intereses\s+Personales)',
-        'references': r'(?:References|Referees|Professional\s+References|Referencias|Árbitros|Referencias\s+Profesionales)',
-        'publications': r'(?:Publications|Published\s+Works|Papers|Publicaciones|Trabajos\s+Publicados|Artículos)',
-        'awards': r'(?:Awards|Honors|Achievements|Recognitions|Premios|Honores|Logros|Reconocimientos)',
-        'volunteering': r'(?:Volunteering|Volunteer\s+Experience|Community\s+Service|Voluntariado|Experiencia\s+de\s+Voluntariado|Servicio\s+Comunitario)',
-    }
-    
     # Get all section matches and their start positions
     section_positions = []
     
-    for section_type, pattern in section_patterns.items():
-        # Look for the pattern at the start of a line or after a clear break
-        full_pattern = r'(?:^|\n\s*|\n\n)(' + pattern + r')(?:\s*:|\s*\n)'
-        for match in re.finditer(full_pattern, text, re.IGNORECASE):
-            # Get position of the end of the match (where content starts)
-            section_title = match.group(1).strip()
-            start_pos = match.end()
-            section_positions.append((start_pos, section_type, section_title))
+    # Resume scanning just past the start of each heading rather than its end,
+    # since a multi-word heading (e.g. "Profile\nWork Experience") can
+    # contain the start of the next one
+    match = _FUSED_SECTION_RE.search(text)
+    while match:
+        section_type = match.lastgroup
+        # Get position of the end of the match (where content starts)
+        section_title = match.group(section_type).strip()
+        start_pos = match.end()
+        section_positions.append((start_pos, section_type, section_title))
+        if len(section_positions) >= MAX_SECTION_HEADINGS:
+            break
+        match = _FUSED_SECTION_RE.search(text, match.start(section_type) + 1)
     
     # Sort by position
     section_positions.sort()
@@ -237,20 +538,142 @@ def identify_sections(text):
         
     return sections
 
-def extract_work_experiences_v2(text):
+# Experience/Education headings used to bound the experience section
+_EXPERIENCE_HEADING_RE = re.compile(r'(?:^|\n\s*|\n\n)(?:Experience|Work\s+Experience|Employment|Professional\s+Experience|Experiencia|Trayectoria)(?:\s*:|\s*\n)', re.IGNORECASE)
+_EDUCATION_HEADING_RE = re.compile(r'(?:^|\n\s*|\n\n)(?:Education|Educational|Academic|Academics|Qualifications|Degrees|Educación|Formación\s+Académica)(?:\s*:|\s*\n)', re.IGNORECASE)
+
+# Comprehensive date-range patterns used to detect job entries
+WORK_DATE_PATTERNS = [
+    # Month Year to Month Year or Present (various formats)
+    r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s*[-–—a]+\s*(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}',
+    r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s*[-–—a]+\s*(?:Present|Current)',
+    r'(?:Enero|Febrero|Marzo|Abril|Mayo|Junio|Julio|Agosto|Septiembre|Octubre|Noviembre|Diciembre)\s+\d{4}\s*[-–—a]+\s*(?:Enero|Febrero|Marzo|Abril|Mayo|Junio|Julio|Agosto|Septiembre|Octubre|Noviembre|Diciembre)\s+\d{4}',
+    r'(?:Enero|Febrero|Marzo|Abril|Mayo|Junio|Julio|Agosto|Septiembre|Octubre|Noviembre|Diciembre)\s+\d{4}\s*[-–—a]+\s*(?:Presente|Actual|Actualidad)',
+
+    # Abbreviated month names
+    r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–—a]+\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}',
+    r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–—a]+\s*(?:Present|Current)',
+    r'(?:Ene|Feb|Mar|Abr|May|Jun|Jul|Ago|Sep|Oct|Nov|Dic)[a-z]*\s+\d{4}\s*[-–—a]+\s*(?:Ene|Feb|Mar|Abr|May|Jun|Jul|Ago|Sep|Oct|Nov|Dic)[a-z]*\s+\d{4}',
+    r'(?:Ene|Feb|Mar|Abr|May|Jun|Jul|Ago|Sep|Oct|Nov|Dic)[a-z]*\s+\d{4}\s*[-–—a]+\s*(?:Presente|Actual|Actualidad)',
+
+    # Just years
+    r'(?<!\d)(19|20)\d{2}\s*[-–—a]+\s*((?:19|20)\d{2}|Present|Current|Presente|Actual|Actualidad)(?!\d)',
+]
+
+# All date patterns in one alternation: a line is searched once, returning the
+# leftmost date range (earlier patterns win at the same position)
+_ALL_DATES_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in WORK_DATE_PATTERNS), re.IGNORECASE)
+
+# A full four-digit year (the group is non-capturing so findall returns whole years)
+_YEAR_RE = re.compile(r'(?:19|20)\d{2}')
+
+def latest_year(date_str):
+    """Return the latest year mentioned in a date string, or 0 if there is none."""
+    if not date_str or date_str == "Unknown":
+        return 0
+    # Years are all four digits, so the largest string is the largest year
+    return int(max(_YEAR_RE.findall(date_str), default=0))
+
+def first_year(date_str):
+    """Return the first year mentioned in a date string, or 0 if there is none."""
+    if not date_str or date_str == "Unknown":
+        return 0
+    match = _YEAR_RE.search(date_str)
+    return int(match.group(0)) if match else 0
+
+def _compile_hyperscan_dates():
+    """Compile all date patterns into one Hyperscan database, or None if unavailable."""
+    if not HAVE_HYPERSCAN:
+        return None
+    # Hyperscan has no lookaround support, so the year-range digit guards are
+    # dropped; the database only finds candidate lines, which _ALL_DATES_RE confirms
+    expressions = [p.replace(r'(?<!\d)', '').replace(r'(?!\d)', '').encode('utf-8')
+                   for p in WORK_DATE_PATTERNS]
+    # UCP gives \s, \d and \w their Unicode meaning, as in Python's re; without
+    # it a non-breaking space (common in PDF text) would hide a date range
+    flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=expressions,
+            ids=list(range(len(expressions))),
+            elements=len(expressions),
+            flags=[flags] * len(expressions)
+        )
+        return db
+    except Exception:
+        return None
+
+_HS_DATE_DB = _compile_hyperscan_dates()
+
+def find_date_lines(section_text, lines):
+    """Return the indices of lines that may contain a date range.
+
+    With Hyperscan available the whole section is scanned once and each match
+    is mapped back to its line; otherwise every line is a candidate.
+    """
+    if _HS_DATE_DB is None:
+        return range(len(lines))
+    
+    # Byte offset at which each line starts in the UTF-8 encoded section
+    line_starts = []
+    offset = 0
+    for line in lines:
+        line_starts.append(offset)
+        offset += len(line.encode('utf-8')) + 1
+    
+    hits = set()
+    def on_match(pattern_id, start, end, flags, context):
+        hits.add(bisect.bisect_right(line_starts, end - 1) - 1)
+    
+    try:
+        _HS_DATE_DB.scan(section_text.encode('utf-8'), match_event_handler=on_match)
+    except Exception as e:
+        print(f"Hyperscan date scan failed, scanning line by line: {str(e)}")
+        return range(len(lines))
+    return sorted(hits)
+
+# One job entry found by extract_work_experiences_v2; much lighter than a dict
+# per entry. Convert with _asdict() where the data leaves the module as JSON.
+WorkExperience = namedtuple('WorkExperience', 'company title date description')
+
+# Words that mark a line as a likely job title
+TITLE_KEYWORDS = ['Director', 'CIO', 'Chief', 'Manager', 'Lead', 'Engineer', 'Developer',
+                  'Architect', 'Analyst', 'Consultant', 'Specialist', 'Asesor', 'Jefe',
+                  'Gerente', 'Ingeniero']
+
+def _build_title_automaton():
+    """Build an Aho-Corasick automaton over TITLE_KEYWORDS, or None if unavailable."""
+    if not HAVE_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in TITLE_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+_TITLE_AUTOMATON = _build_title_automaton()
+
+def has_title_keyword(candidate):
+    """Return True if any job title keyword occurs in the candidate line."""
+    if _TITLE_AUTOMATON is not None:
+        return next(_TITLE_AUTOMATON.iter(candidate), None) is not None
+    return any(keyword in candidate for keyword in TITLE_KEYWORDS)
+
+def extract_work_experiences_v2(text, sections=None):
     """Extract work experiences by identifying date ranges as primary indicators of job entries
-    within the content between Experience and Education sections."""
+    within the content between Experience and Education sections.
+    
+    `sections` may be passed in if identify_sections(text) was already computed.
+    Returns a list of WorkExperience tuples, newest first."""
     work_experiences = []
     
     # First, find the Experience section
     experience_section = None
     
     # Try to find the section boundaries (Experience to Education)
-    experience_pattern = r'(?:^|\n\s*|\n\n)(?:Experience|Work\s+Experience|Employment|Professional\s+Experience|Experiencia|Trayectoria)(?:\s*:|\s*\n)'
-    education_pattern = r'(?:^|\n\s*|\n\n)(?:Education|Educational|Academic|Academics|Qualifications|Degrees|Educación|Formación\s+Académica)(?:\s*:|\s*\n)'
-    
-    experience_match = re.search(experience_pattern, text, re.IGNORECASE)
-    education_match = re.search(education_pattern, text, re.IGNORECASE)
+    experience_match = _EXPERIENCE_HEADING_RE.search(text)
+    education_match = _EDUCATION_HEADING_RE.search(text)
     
     if experience_match:
         start_idx = experience_match.end()
@@ -263,7 +686,8 @@ def extract_work_experiences_v2(text):
     
     if not experience_section:
         # Fallback: use identify_sections if direct search fails
-        sections = identify_sections(text)
+        if sections is None:
+            sections = identify_sections(text)
         if 'experience' in sections:
             experience_section = sections['experience']
         else:
@@ -271,35 +695,18 @@ def extract_work_experiences_v2(text):
     
     print(f"Found experience section with {len(experience_section)} characters")
     
-    # Define comprehensive date patterns to detect all job entries
-    date_patterns = [
-        # Month Year to Month Year or Present (various formats)
-        r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s*[-–—a]+\s*(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}',
-        r'(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}\s*[-–—a]+\s*(?:Present|Current)',
-        r'(?:Enero|Febrero|Marzo|Abril|Mayo|Junio|Julio|Agosto|Septiembre|Octubre|Noviembre|Diciembre)\s+\d{4}\s*[-–—a]+\s*(?:Enero|Febrero|Marzo|Abril|Mayo|Junio|Julio|Agosto|Septiembre|Octubre|Noviembre|Diciembre)\s+\d{4}',
-        r'(?:Enero|Febrero|Marzo|Abril|Mayo|Junio|Julio|Agosto|Septiembre|Octubre|Noviembre|Diciembre)\s+\d{4}\s*[-–—a]+\s*(?:Presente|Actual|Actualidad)',
-        
-        # Abbreviated month names
-        r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–—a]+\s*(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}',
-        r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\s*[-–—a]+\s*(?:Present|Current)',
-        r'(?:Ene|Feb|Mar|Abr|May|Jun|Jul|Ago|Sep|Oct|Nov|Dic)[a-z]*\s+\d{4}\s*[-–—a]+\s*(?:Ene|Feb|Mar|Abr|May|Jun|Jul|Ago|Sep|Oct|Nov|Dic)[a-z]*\s+\d{4}',
-        r'(?:Ene|Feb|Mar|Abr|May|Jun|Jul|Ago|Sep|Oct|Nov|Dic)[a-z]*\s+\d{4}\s*[-–—a]+\s*(?:Presente|Actual|Actualidad)',
-        
-        # Just years
-        r'(?<!\d)(19|20)\d{2}\s*[-–—a]+\s*((?:19|20)\d{2}|Present|Current|Presente|Actual|Actualidad)(?!\d)',
-    ]
-    
     # Convert the experience section text to lines for easier processing
     lines = experience_section.split('\n')
+    # Strip each line once; the job parsing below compares stripped lines repeatedly
+    stripped = [line.strip() for line in lines]
+    starts_upper = [bool(line) and line[0].isupper() for line in stripped]
     
     # Find all date range occurrences - each indicates a job entry
     date_positions = []
-    for i, line in enumerate(lines):
-        for pattern in date_patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
-            if match:
-                date_positions.append((i, match.group(0)))
-                break
+    for i in find_date_lines(experience_section, lines):
+        match = _ALL_DATES_RE.search(lines[i])
+        if match:
+            date_positions.append((i, match.group(0)))
     
     # If no date ranges were found, return empty list
     if not date_positions:
@@ -317,25 +724,20 @@ def extract_work_experiences_v2(text):
         else:
             end_idx = len(lines)
         
-        # Get job text (including date line)
-        job_lines = lines[start_idx:end_idx]
-        job_text = '\n'.join(job_lines)
-        
         # Extract company name (typically directly above or in the same line as the date)
         company = "Unknown"
         title = "Unknown"
         
         # Look for company name - typically on the line before the date or same line
         if start_idx > 0:  # Check if there's a line before the date line
-            company_line = lines[start_idx - 1].strip()
-            if company_line and company_line[0].isupper():  # Likely company name (capitalized)
-                company = company_line
+            if starts_upper[start_idx - 1]:  # Likely company name (capitalized)
+                company = stripped[start_idx - 1]
         
         # If company wasn't found above, look for it in the job text using capitalized lines
         if company == "Unknown":
-            for line in job_lines[:2]:  # Check first couple of lines in this job block
-                if line.strip() and line.strip()[0].isupper() and len(line.strip().split()) <= 5:
-                    company = line.strip()
+            for k in range(start_idx, min(start_idx + 2, end_idx)):  # Check first couple of lines in this job block
+                if starts_upper[k] and len(stripped[k].split()) <= 5:
+                    company = stripped[k]
                     break
         
         # Look for job title - typically directly above the date or above company
@@ -343,26 +745,22 @@ def extract_work_experiences_v2(text):
             title_candidates = []
             
             # Check if line before date might be a title
-            if start_idx > 0 and company != lines[start_idx - 1].strip():
-                title_candidates.append(lines[start_idx - 1].strip())
+            if start_idx > 0 and company != stripped[start_idx - 1]:
+                title_candidates.append(stripped[start_idx - 1])
             
             # Check if line before company might be a title
-            if start_idx > 1 and company == lines[start_idx - 1].strip():
-                title_candidates.append(lines[start_idx - 2].strip())
+            if start_idx > 1 and company == stripped[start_idx - 1]:
+                title_candidates.append(stripped[start_idx - 2])
                 
             # Check the first line of job text that's not a date or company
-            for line in job_lines:
-                if line != company and date_text not in line:
-                    title_candidates.append(line.strip())
+            for k in range(start_idx, end_idx):
+                if lines[k] != company and date_text not in lines[k]:
+                    title_candidates.append(stripped[k])
                     break
             
             # Pick the best candidate (prioritize job title keywords)
-            title_keywords = ['Director', 'CIO', 'Chief', 'Manager', 'Lead', 'Engineer', 'Developer', 
-                             'Architect', 'Analyst', 'Consultant', 'Specialist', 'Asesor', 'Jefe', 
-                             'Gerente', 'Ingeniero']
-            
             for candidate in title_candidates:
-                if any(keyword in candidate for keyword in title_keywords):
+                if has_title_keyword(candidate):
                     title = candidate
                     break
             
@@ -372,34 +770,21 @@ def extract_work_experiences_v2(text):
         
         # Create a description by excluding the company and title lines
         description_lines = []
-        for line in job_lines:
+        for k in range(start_idx, end_idx):
             # Exclude empty lines at the beginning
-            if not line.strip() and not description_lines:
+            if not stripped[k] and not description_lines:
                 continue
             # Keep all other lines, including the date line
-            if line.strip() != company and line.strip() != title:
-                description_lines.append(line)
+            if stripped[k] != company and stripped[k] != title:
+                description_lines.append(lines[k])
         
         description = '\n'.join(description_lines).strip()
         
         # Add this job experience
-        work_experiences.append({
-            'company': company,
-            'title': title,
-            'date': date_text,
-            'description': description
-        })
-    
-    # Sort by date (newest first)
-    def extract_year(date_str):
-        if not date_str or date_str == "Unknown":
-            return 0
-        years = re.findall(r'(19|20)\d{2}', date_str)
-        if years:
-            return max(int(y) for y in years)
-        return 0
+        work_experiences.append(WorkExperience(company, title, date_text, description))
     
-    work_experiences.sort(key=lambda x: extract_year(x['date']), reverse=True)
+    # Sort by date (newest first); sort() computes each key only once
+    work_experiences.sort(key=lambda job: latest_year(job.date), reverse=True)
     
     print(f"Extracted {len(work_experiences)} job experiences")
     return work_experiences
@@ -425,41 +810,50 @@ def extract_structured_info(text):
     sections = identify_sections(text)
     data['sections'] = {k: v for k, v in sections.items()} # Store raw sections if needed
     
-    # Extract work experiences using the refined v2 function
-    data['work_experiences'] = extract_work_experiences_v2(text)
+    # Extract work experiences using the refined v2 function (as plain dicts for JSON output)
+    data['work_experiences'] = [job._asdict() for job in extract_work_experiences_v2(text, sections)]
     
     # Call other extraction functions
-    data['email'] = extract_email(text)
+    data.update(extract_contact_info(text))
     data['phone'] = extract_phone(text)
-    data['linkedin'] = extract_linkedin(text)
-    data['github'] = extract_github(text)
-    data['website'] = extract_website(text)
     data['name'] = extract_name(text)
     data['location'] = extract_location(text)
     # Extract overall job title (often near name) - might differ from specific experience titles
     data['job_title'] = extract_job_title(text) 
     data['skills'] = extract_skills(sections.get('skills', text)) # Extract from skills section or full text
-    data['education'] = extract_education(sections.get('education', text)) # Extract from education section or full text
+    data['education'] = extract_education(text, sections) # Parse the education section found above
     
     return data
 
+# A blank (or whitespace-only) line between two paragraphs
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+
+def split_paragraphs(text):
+    """Split text into paragraphs separated by blank lines."""
+    return _PARAGRAPH_BREAK_RE.split(text)
+
+# Common job title patterns (including Spanish)
+JOB_TITLE_PATTERNS = [
+    r'\b(?:Senior|Lead|Principal|Junior|Staff|Director[a]?|Jefe[a]?|Gerente)\b',
+    r'\b(?:Software|Data|Full Stack|Frontend|Backend|Web|Mobile|UI|UX|DevOps|Cloud|Machine Learning|AI|QA|CIO|CTO|CEO|VP|Manager)\b',
+    r'\b(?:Engineer|Developer|Scientist|Analyst|Designer|Architect|Manager|Director|Consultant|Specialist|Ingeniero|Desarrollador|Analista|Consultor[a]?)\b'
+]
+
+# Date patterns (a year range or a month and year)
+JOB_DATE_PATTERNS = [
+    r'\b(19|20)\d{2}\s*[-–—a]*\s*((?:19|20)\d{2}|[Pp]resent|[Cc]urrent|[Aa]ctual|[Aa]ctualidad|[Pp]resente)\b',
+    r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Ene|Feb|Mar|Abr|May|Jun|Jul|Ago|Sep|Oct|Nov|Dic)\w*\s+\d{4}\b'
+]
+
+# Each pattern group joined into one alternation: a paragraph only needs to
+# match any one of them
+_JOB_TITLE_COMBINED_RE = re.compile('|'.join(JOB_TITLE_PATTERNS))
+_JOB_DATE_COMBINED_RE = re.compile('|'.join(JOB_DATE_PATTERNS))
+
 def extract_job_entries(text):
     """Extract job entries from text even without section headers."""
     job_entries = []
     
-    # Common job title patterns (including Spanish)
-    job_title_patterns = [
-        r'\b(?:Senior|Lead|Principal|Junior|Staff|Director[a]?|Jefe[a]?|Gerente)\b',
-        r'\b(?:Software|Data|Full Stack|Frontend|Backend|Web|Mobile|UI|UX|DevOps|Cloud|Machine Learning|AI|QA|CIO|CTO|CEO|VP|Manager)\b',
-        r'\b(?:Engineer|Developer|Scientist|Analyst|Designer|Architect|Manager|Director|Consultant|Specialist|Ingeniero|Desarrollador|Analista|Consultor[a]?)\b'
-    ]
-    
-    # Date patterns
-    date_patterns = [
-        r'\b(19|20)\d{2}\s*[-–—a]*\s*((?:19|20)\d{2}|[Pp]resent|[Cc]urrent|[Aa]ctual|[Aa]ctualidad|[Pp]resente)\b',
-        r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Ene|Feb|Mar|Abr|May|Jun|Jul|Ago|Sep|Oct|Nov|Dic)\w*\s+\d{4}\b'
-    ]
-    
     # Company patterns
     company_patterns = [
         r'\b(?:[A-Z][a-z]*){2,}\s+(?:Inc|LLC|Ltd|SA|SPA|SL|GmbH|Corp|Corporation|Company|Consulting|Systems|Technologies|Solutions)\b',
@@ -467,14 +861,11 @@ def extract_job_entries(text):
     ]
     
     # Split text into paragraphs or chunks
-    paragraphs = re.split(r'\n\s*\n', text)
+    paragraphs = split_paragraphs(text)
     
     for para in paragraphs:
-        # Check if paragraph looks like a job entry
-        has_job_title = any(re.search(pattern, para) for pattern in job_title_patterns)
-        has_date = any(re.search(pattern, para) for pattern in date_patterns)
-        
-        if has_job_title and has_date:
+        # Check if paragraph looks like a job entry (has both a job title and a date)
+        if _JOB_TITLE_COMBINED_RE.search(para) and _JOB_DATE_COMBINED_RE.search(para):
             job_entries.append(para)
         
     return job_entries
@@ -555,7 +946,7 @@ def extract_work_experiences(text):
     
     # Split by potential job entries
     # Look for patterns that indicate a new job entry, like a company name followed by a job title and date
-    potential_entries = re.split(r'\n\s*\n', process_text)
+    potential_entries = split_paragraphs(process_text)
     
     # Process each potential job entry
     for entry in potential_entries:
@@ -629,24 +1020,26 @@ def extract_work_experiences(text):
     
     # Direct extraction for specific companies we know should be in the CV
     if len(work_experiences) < 3:  # If we didn't get enough job entries, try direct extraction
+        # Split once; every company search below works on the same lines
+        lines = text.split('\n')
         for company in ["QwerTI Consultores", "Quantum Discoveries", "Instituto Nacional", "Ministerio de Vivienda", "Servel Chile"]:
             company_section = None
             # Find the section for this company
-            for i, line in enumerate(text.split('\n')):
+            for i, line in enumerate(lines):
                 if company in line:
                     # Extract from this line until we find another potential company or section header
                     start_idx = i
-                    end_idx = len(text.split('\n'))
+                    end_idx = len(lines)
                     
-                    for j in range(i + 1, len(text.split('\n'))):
-                        line_j = text.split('\n')[j]
+                    for j in range(i + 1, len(lines)):
+                        line_j = lines[j]
                         # Check if this might be another company or section
                         if any(c in line_j for c in ["QwerTI", "Quantum", "Instituto", "Ministerio", "Servel", "Independiente"]) or \
                            re.search(r'\b(?:Education|Skills|Educación|Habilidades)\b', line_j, re.IGNORECASE):
                             end_idx = j
                             break
                     
-                    company_section = '\n'.join(text.split('\n')[start_idx:end_idx])
+                    company_section = '\n'.join(lines[start_idx:end_idx])
                     
                     # Try to extract job details from this section
                     title_match = None
@@ -684,194 +1077,324 @@ def extract_work_experiences(text):
                     break
     
     # Sort jobs by date (recent first)
-    def extract_year(date_str):
-        if not date_str or date_str == "Unknown":
-            return 0
-        match = re.search(r'(19|20)\d{2}', date_str)
-        if match:
-            return int(match.group(0))
-        return 0
-        
-    work_experiences.sort(key=lambda x: extract_year(x['date']), reverse=True)
+    work_experiences.sort(key=lambda x: first_year(x['date']), reverse=True)
     
     return work_experiences
 
+# Number of recent CV texts whose results each single-value extractor keeps,
+# so calling several extractors (or the same one twice) on a text is cheap
+EXTRACTOR_CACHE_SIZE = 32
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def lower_text(text):
+    """Lowercase text once for the case-folded patterns (contacts, skills).
+    
+    Every character keeps its offset, so a match span in the result can be used
+    to slice the original text and return the value in its original case.
+    """
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # A few characters (e.g. 'İ') lowercase to several; leave those as is
+        lowered = ''.join(char if len(char.lower()) != 1 else char.lower() for char in text)
+    return lowered
+
+# Email, LinkedIn, GitHub and website URLs found with one pattern (see _find_contacts).
+# The LinkedIn /in/ and /profile/ forms share one group; /profile/ URLs are
+# only used when no /in/ URL is found. The www. variants are matched by the
+# bare-domain patterns.
+# The pattern is matched against lower_text(text), so it needs no case folding.
+# Website URLs on common platforms are filtered out afterwards (see
+# _is_blocked_website) rather than with a lookahead tried at every URL
+# position. It stays on re (not RE2) because the website \b must see accented
+# letters as word characters.
+_CONTACT_RE = re.compile(
+    r'(?P<email>[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,})'
+    r'|(?P<linkedin>linkedin\.com/(?:in|profile)/[a-z0-9_-]+/?)'
+    r'|(?P<github>github\.com/[a-z0-9_-]+/?)'
+    r'|(?P<website>https?://(?:www\.)?[-a-z0-9@:%._\+~#=]{1,256}\.[a-z0-9()]{1,6}\b(?:[-a-z0-9()@:%_\+.~#?&//=]*))'
+)
+_CONTACT_FIELDS = frozenset(('email', 'linkedin', 'github', 'website'))
+
+# Platforms that are not a personal website (LinkedIn, GitHub, social media)
+_BLOCKED_WEBSITE_HOSTS = ('linkedin.com', 'github.com', 'facebook.com', 'twitter.com', 'instagram.com')
+
+def _is_blocked_website(url):
+    """Return True if the (lowercase) URL points at one of _BLOCKED_WEBSITE_HOSTS."""
+    host = url.split('://', 1)[1]
+    if host.startswith('www.'):
+        host = host[4:]
+    return host.startswith(_BLOCKED_WEBSITE_HOSTS)
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
+def _find_contacts(text):
+    """Cached scan behind extract_contact_info; the result must not be modified."""
+    found = {}
+    lowered = lower_text(text)
+    match = _CONTACT_RE.search(lowered)
+    while match:
+        field = match.lastgroup
+        # The 14th character is the first letter after 'linkedin.com/': /in/ or /profile/
+        if field == 'linkedin' and match.group(0)[13] == 'p':
+            field = 'linkedin_profile'
+        if field != 'website' or not _is_blocked_website(match.group(0)):
+            found.setdefault(field, text[match.start():match.end()])
+            if _CONTACT_FIELDS <= found.keys():
+                break
+        if field == 'website':
+            # Rescan inside the URL: it can contain the other fields (a LinkedIn
+            # or GitHub profile, an email in its query string)
+            match = _CONTACT_RE.search(lowered, match.start() + 1)
+        else:
+            match = _CONTACT_RE.search(lowered, match.end())
+    
+    return {
+        'email': found.get('email'),
+        'linkedin': found.get('linkedin') or found.get('linkedin_profile'),
+        'github': found.get('github'),
+        'website': found.get('website')
+    }
+
+def extract_contact_info(text):
+    """Extract the first email, LinkedIn, GitHub and website URL from text."""
+    return dict(_find_contacts(text))
+
 def extract_email(text):
     """Extract email addresses from text."""
-    # Match common email patterns
-    email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-    emails = re.findall(email_pattern, text)
-    if emails:
-        return emails[0]  # Return the first email found
-    return None
+    return _find_contacts(text)['email']
 
+# Phone number formats in one alternation, most specific first; the leftmost
+# number in the text wins. The simple 123-456-7890 form is already covered by
+# the US/CA alternative.
+_PHONE_RE = re.compile(
+    r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'  # US/CA: (123) 456-7890
+    r'|\+?\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{3}[-.\s]?\d{4}'  # International: +12 3456 7890
+    r'|\+?\d{1,3}[-.\s]?\d{6,12}'  # International compact: +123456789012
+)
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
 def extract_phone(text):
     """Extract phone numbers from text."""
-    # Match various phone number formats
-    phone_patterns = [
-        r'(?:\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # US/CA: (123) 456-7890
-        r'\+?\d{1,3}[-.\s]?\d{1,4}[-.\s]?\d{3}[-.\s]?\d{4}',  # International: +12 3456 7890
-        r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # Simple: 123-456-7890
-        r'\+?\d{1,3}[-.\s]?\d{6,12}'  # International compact: +123456789012
-    ]
-    
-    for pattern in phone_patterns:
-        phones = re.findall(pattern, text)
-        if phones:
-            return phones[0]  # Return the first phone number found
-    
-    return None
+    match = _PHONE_RE.search(text)
+    return match.group(0) if match else None
 
 def extract_linkedin(text):
     """Extract LinkedIn URLs from text."""
-    # Match LinkedIn profile URLs
-    linkedin_patterns = [
-        r'linkedin\.com/in/[a-zA-Z0-9_-]+/?',
-        r'linkedin\.com/profile/[a-zA-Z0-9_-]+/?',
-        r'www\.linkedin\.com/in/[a-zA-Z0-9_-]+/?'
-    ]
-    
-    for pattern in linkedin_patterns:
-        linkedin = re.findall(pattern, text, re.IGNORECASE)
-        if linkedin:
-            return linkedin[0]
-    
-    return None
+    return _find_contacts(text)['linkedin']
 
 def extract_github(text):
     """Extract GitHub URLs from text."""
-    # Match GitHub profile URLs
-    github_patterns = [
-        r'github\.com/[a-zA-Z0-9_-]+/?',
-        r'www\.github\.com/[a-zA-Z0-9_-]+/?'
-    ]
-    
-    for pattern in github_patterns:
-        github = re.findall(pattern, text, re.IGNORECASE)
-        if github:
-            return github[0]
-    
-    return None
+    return _find_contacts(text)['github']
 
 def extract_website(text):
     """Extract personal websites from text."""
-    # Match website URLs (excluding common platforms like LinkedIn, GitHub)
-    website_pattern = r'https?://(?!(?:www\.)?(?:linkedin|github|facebook|twitter|instagram)\.com)(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&//=]*)'
-    
-    websites = re.findall(website_pattern, text, re.IGNORECASE)
-    if websites:
-        return websites[0]
-    
-    return None
+    return _find_contacts(text)['website']
 
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
 def extract_name(text):
     """Extract name from CV."""
-    # Try to find name at the beginning of the CV (usually first line)
-    lines = text.split('\n')
-    for line in lines[:3]:  # Check first 3 lines
-        if line and len(line.strip().split()) <= 4 and len(line.strip()) > 3:
+    # Try to find name at the beginning of the CV (usually first line).
+    # Only the first 3 lines are cut out; the rest of the text is never split.
+    start = 0
+    for _ in range(3):  # Check first 3 lines
+        end = text.find('\n', start)
+        if end < 0:
+            end = len(text)
+        line = text[start:end].strip()
+        if len(line) > 3 and len(line.split()) <= 4:
             # Names typically have 1-4 words and more than 3 characters
-            return line.strip()
+            return line
+        if end == len(text):
+            break
+        start = end + 1
     
     return None
 
+# Common location patterns, tried in order
+_LOCATION_RES = tuple(re.compile(pattern) for pattern in [
+    r'\b(?:[A-Z][a-z]+ ?){1,2}(?:,)? [A-Z]{2} \d{5}\b',  # City, STATE ZIP
+    r'\b(?:[A-Z][a-z]+ ?){1,2}(?:,)? [A-Z]{2}\b',  # City, STATE
+    r'(?:Chile|Santiago|España|Mexico|Colombia|Argentina)(?:,\s*[A-Za-z\s]+)?',  # Common Spanish locations
+    r'(?:Region|Región) (?:Metropolitana|del Bio-?Bío|de Valparaíso)',  # Chilean regions
+])
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
 def extract_location(text):
     """Extract location/address from CV."""
-    # Common location patterns
-    location_patterns = [
-        r'\b(?:[A-Z][a-z]+ ?){1,2}(?:,)? [A-Z]{2} \d{5}\b',  # City, STATE ZIP
-        r'\b(?:[A-Z][a-z]+ ?){1,2}(?:,)? [A-Z]{2}\b',  # City, STATE
-        r'(?:Chile|Santiago|España|Mexico|Colombia|Argentina)(?:,\s*[A-Za-z\s]+)?',  # Common Spanish locations
-        r'(?:Region|Región) (?:Metropolitana|del Bio-?Bío|de Valparaíso)',  # Chilean regions
-    ]
-    
-    for pattern in location_patterns:
-        locations = re.findall(pattern, text)
-        if locations:
-            return locations[0]
+    for location_re in _LOCATION_RES:
+        match = location_re.search(text)
+        if match:
+            return match.group(0)
     
     return None
 
+# Common job title patterns
+_TITLE_PATTERNS = [
+    r'\b(?:Senior|Lead|Principal|Junior|Staff)?\s?(?:Software|Data|Full Stack|Frontend|Backend|Web|Mobile|UI|UX|DevOps|Cloud|Machine Learning|AI|QA)?\s?(?:Engineer|Developer|Scientist|Analyst|Designer|Architect|Manager|Director|Consultant|Specialist)\b',
+    r'\b(?:CIO|CTO|CEO|VP|Director(?:a)?|Gerente|Jefe(?:a)?)\b',
+    r'\b(?:Ingeniero|Desarrollador|Analista|Consultor|Arquitecto|Especialista)(?:a)?\b',
+]
+# Union of the title patterns; the first title mentioned in the text wins
+_TITLES_UNION_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in _TITLE_PATTERNS))
+
+@lru_cache(maxsize=EXTRACTOR_CACHE_SIZE)
 def extract_job_title(text):
     """Extract current job title from CV."""
-    # Common job title patterns
-    title_patterns = [
-        r'\b(?:Senior|Lead|Principal|Junior|Staff)?\s?(?:Software|Data|Full Stack|Frontend|Backend|Web|Mobile|UI|UX|DevOps|Cloud|Machine Learning|AI|QA)?\s?(?:Engineer|Developer|Scientist|Analyst|Designer|Architect|Manager|Director|Consultant|Specialist)\b',
-        r'\b(?:CIO|CTO|CEO|VP|Director(?:a)?|Gerente|Jefe(?:a)?)\b',
-        r'\b(?:Ingeniero|Desarrollador|Analista|Consultor|Arquitecto|Especialista)(?:a)?\b',
-    ]
-    
-    for pattern in title_patterns:
-        titles = re.findall(pattern, text)
-        if titles:
-            return titles[0]
+    match = _TITLES_UNION_RE.search(text)
+    if match:
+        return match.group(0)
     
     return None
 
-def extract_skills(text):
-    """Extract skills from CV."""
-    # Common skill patterns
-    skill_patterns = [
-        # Programming languages
-        r'\b(?:Python|Java|JavaScript|TypeScript|C\+\+|C#|PHP|Ruby|Swift|Kotlin|Go|Rust|SQL|HTML|CSS|R|Matlab|Scala|Perl|Shell|Bash)\b',
-        # Frameworks and libraries
-        r'\b(?:React|Angular|Vue|Node\.js|Express|Django|Flask|Spring|Laravel|Rails|TensorFlow|PyTorch|Scikit-learn|Pandas)\b',
-        # Tools and platforms
-        r'\b(?:Git|Docker|Kubernetes|AWS|Azure|GCP|Jenkins|Jira|Confluence|Tableau|PowerBI|Excel|Word|PowerPoint|Photoshop|Illustrator)\b',
-        # Soft skills (including Spanish)
-        r'\b(?:Leadership|Communication|Teamwork|Problem-solving|Critical thinking|Time management|Project management|Agile|Scrum|Liderazgo|Comunicación|Trabajo en equipo|Resolución de problemas|Gestión de tiempo|Gestión de proyectos)\b',
-        # Security related (given the CV content)
-        r'\b(?:ISO 27001|ISO 27000|Information Security|Cybersecurity|Security|SOX|Seguridad Informática|Ciberseguridad)\b',
-    ]
+# Common skills, grouped by kind
+SKILL_KEYWORDS = [
+    # Programming languages
+    'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'PHP', 'Ruby', 'Swift', 'Kotlin',
+    'Go', 'Rust', 'SQL', 'HTML', 'CSS', 'R', 'Matlab', 'Scala', 'Perl', 'Shell', 'Bash',
+    # Frameworks and libraries
+    'React', 'Angular', 'Vue', 'Node.js', 'Express', 'Django', 'Flask', 'Spring', 'Laravel',
+    'Rails', 'TensorFlow', 'PyTorch', 'Scikit-learn', 'Pandas',
+    # Tools and platforms
+    'Git', 'Docker', 'Kubernetes', 'AWS', 'Azure', 'GCP', 'Jenkins', 'Jira', 'Confluence',
+    'Tableau', 'PowerBI', 'Excel', 'Word', 'PowerPoint', 'Photoshop', 'Illustrator',
+    # Soft skills (including Spanish)
+    'Leadership', 'Communication', 'Teamwork', 'Problem-solving', 'Critical thinking',
+    'Time management', 'Project management', 'Agile', 'Scrum', 'Liderazgo', 'Comunicación',
+    'Trabajo en equipo', 'Resolución de problemas', 'Gestión de tiempo', 'Gestión de proyectos',
+    # Security related (given the CV content)
+    'ISO 27001', 'ISO 27000', 'Information Security', 'Cybersecurity', 'Security', 'SOX',
+    'Seguridad Informática', 'Ciberseguridad',
+]
+
+# All skills in a single alternation, so the text is scanned once. Matched
+# against lower_text(text), like the skill automaton below.
+_SKILLS_RE = re.compile(r'\b(?:' + '|'.join(re.escape(skill.lower()) for skill in SKILL_KEYWORDS) + r')\b')
+
+def _build_skill_automaton():
+    """Build an Aho-Corasick automaton over the lowercased SKILL_KEYWORDS, or None if unavailable."""
+    if not HAVE_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for index, skill in enumerate(SKILL_KEYWORDS):
+        keyword = skill.lower()
+        automaton.add_word(keyword, (index, len(keyword)))
+    automaton.make_automaton()
+    return automaton
+
+_SKILL_AUTOMATON = _build_skill_automaton()
+
+def _is_word_char(char):
+    """Return True for characters that \\w matches."""
+    return char.isalnum() or char == '_'
+
+def _is_word_boundary(text, pos):
+    """Return True if \\b matches at text position pos."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+def _find_skills_automaton(text, lowered):
+    """Find skills with _SKILL_AUTOMATON, giving the same matches as _SKILLS_RE."""
+    hits = []
+    for last, (index, length) in _SKILL_AUTOMATON.iter(lowered):
+        start, end = last + 1 - length, last + 1
+        if _is_word_boundary(text, start) and _is_word_boundary(text, end):
+            hits.append((start, index, end))
     
+    # Like finditer: leftmost match first, the earlier listed skill on a tie,
+    # and nothing that overlaps a match already taken
+    hits.sort()
     skills = set()
-    for pattern in skill_patterns:
-        skill_matches = re.findall(pattern, text, re.IGNORECASE)
-        skills.update(skill_matches)
+    taken_end = 0
+    for start, _, end in hits:
+        if start >= taken_end:
+            skills.add(text[start:end])
+            taken_end = end
+    return skills
+
+def extract_skills(text):
+    """Extract skills from CV."""
+    lowered = lower_text(text)
+    if _SKILL_AUTOMATON is not None:
+        skills = _find_skills_automaton(text, lowered)
+    else:
+        skills = set(text[match.start():match.end()] for match in _SKILLS_RE.finditer(lowered))
     
     return list(skills) if skills else []
 
-def extract_education(text):
-    """Extract education information from CV."""
+# Degree information (bachelor, master, doctorate)
+_DEGREE_PATTERNS = [
+    r'(?:Bachelor|BA|BS|B\.A\.|B\.S\.|Licenciatura|Grado|Licenciado|Graduado)(?:\sof\s(?:Science|Arts|Business|Engineering)|(?:\sen\s[A-Za-z\s]+))?',
+    r'(?:Master|MA|MS|M\.A\.|M\.S\.|MBA|M\.B\.A\.|Máster|Maestría)(?:\sof\s(?:Science|Arts|Business|Engineering)|(?:\sen\s[A-Za-z\s]+))?',
+    r'(?:Doctor|PhD|Ph\.D\.|Doctorate|Doctorado)(?:\sof\s(?:Science|Arts|Philosophy|Engineering)|(?:\sen\s[A-Za-z\s]+))?',
+]
+
+# Institution names
+_INSTITUTION_PATTERN = r'[A-Z][a-zA-Z\s&]+(?:University|College|School|Institute|Universidad|Escuela|Instituto)'
+_INSTITUTION_RE = re.compile(_INSTITUTION_PATTERN)
+
+# Degree, institution and study period (e.g. "2004 - 2006" or "2019 - Present")
+# in one pattern, dispatched on lastgroup. Only the degree alternatives are
+# case insensitive; institution names must start with a capital letter.
+_EDUCATION_RE = re.compile(
+    '(?i:(?P<degree>' + '|'.join(f'(?:{pattern})' for pattern in _DEGREE_PATTERNS) + '))'
+    f'|(?P<institution>{_INSTITUTION_PATTERN})'
+    r'|(?P<date>(?P<date_from>(?:19|20)\d{2})\s*[-–—a]+\s*(?P<date_to>(?:19|20)\d{2}|[Pp]resent|[Cc]urrent|[Aa]ctual))'
+)
+
+def _scan_education_paragraph(text, start, end):
+    """Return the first degree, institution and date match in text[start:end], by group name."""
+    found = {}
+    match = _EDUCATION_RE.search(text, start, end)
+    while match:
+        found.setdefault(match.lastgroup, match)
+        if match.lastgroup == 'degree' and 'institution' not in found:
+            # An institution starting at the same position (e.g. "Master of
+            # Engineering at Stanford University") is hidden by the degree
+            institution = _INSTITUTION_RE.match(text, match.start(), end)
+            if institution:
+                found['institution'] = institution
+        if len(found) == 3:
+            break
+        # Resume inside the match so a field overlapping it is still found
+        match = _EDUCATION_RE.search(text, match.start() + 1, end)
+    return found
+
+def _paragraph_spans(text):
+    """Yield the (start, end) span of each paragraph, splitting like split_paragraphs.
+    
+    Spans are yielded lazily from the break matches, so no list of paragraphs
+    (or of paragraph breaks) is built.
+    """
+    start = 0
+    for match in _PARAGRAPH_BREAK_RE.finditer(text):
+        yield start, match.start()
+        start = match.end()
+    yield start, len(text)
+
+def extract_education(text, sections=None):
+    """Extract education information from CV.
+    
+    `sections` may be passed in if identify_sections(text) was already computed.
+    """
     education = []
     
     # Try to find the education section
-    sections = identify_sections(text)
+    if sections is None:
+        sections = identify_sections(text)
     education_section = sections.get('education', '')
     
     # If we have an education section, parse it
     if education_section:
-        # Extract degree information from the education section
-        degree_patterns = [
-            r'(?:Bachelor|BA|BS|B\.A\.|B\.S\.|Licenciatura|Grado|Licenciado|Graduado)(?:\sof\s(?:Science|Arts|Business|Engineering)|(?:\sen\s[A-Za-z\s]+))?',
-            r'(?:Master|MA|MS|M\.A\.|M\.S\.|MBA|M\.B\.A\.|Máster|Maestría)(?:\sof\s(?:Science|Arts|Business|Engineering)|(?:\sen\s[A-Za-z\s]+))?',
-            r'(?:Doctor|PhD|Ph\.D\.|Doctorate|Doctorado)(?:\sof\s(?:Science|Arts|Philosophy|Engineering)|(?:\sen\s[A-Za-z\s]+))?',
-        ]
-        
-        # Extract institution names
-        institution_pattern = r'([A-Z][a-zA-Z\s&]+(?:University|College|School|Institute|Universidad|Escuela|Instituto))'
-        
-        # Split the education section into paragraphs
-        paragraphs = re.split(r'\n\s*\n', education_section)
-        
-        for paragraph in paragraphs:
-            if not paragraph.strip():
-                continue
-                
-            # Try to extract degree, institution, date
-            degree = None
-            for pattern in degree_patterns:
-                matches = re.findall(pattern, paragraph, re.IGNORECASE)
-                if matches:
-                    degree = matches[0]
-                    break
-                    
-            institutions = re.findall(institution_pattern, paragraph)
-            institution = institutions[0] if institutions else None
+        # Scan the section paragraph by paragraph in place, bounding each
+        # search by the paragraph end instead of slicing the paragraphs out
+        for start, end in _paragraph_spans(education_section):
+            found = _scan_education_paragraph(education_section, start, end)
             
-            # Look for dates
-            dates = re.findall(r'(19|20)\d{2}\s*[-–—a]+\s*((?:19|20)\d{2}|[Pp]resent|[Cc]urrent|[Aa]ctual)', paragraph)
-            date = f"{dates[0][0]}-{dates[0][1]}" if dates else None
+            # Try to extract degree, institution, date
+            degree = found['degree'].group(0) if 'degree' in found else None
+            institution = found['institution'].group(0) if 'institution' in found else None
+            match = found.get('date')
+            date = f"{match.group('date_from')}-{match.group('date_to')}" if match else None
             
             if degree or institution:
                 education.append({
@@ -887,6 +1410,7 @@ if __name__ == "__main__":
     parser.add_argument('--file', help='PDF file path')
     parser.add_argument('--data', help='Base64-encoded PDF data')
     parser.add_argument('--output', help='Output file (if not specified, prints to stdout)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore and do not update the extraction cache')
     
     args = parser.parse_args()
     
@@ -896,7 +1420,7 @@ if __name__ == "__main__":
     
     try:
         print(f"Starting extraction from file: {args.file}" if args.file else "Starting extraction from base64 data")
-        result = extract_from_pdf(pdf_path=args.file, pdf_data=args.data)
+        result = extract_from_pdf(pdf_path=args.file, pdf_data=args.data, use_cache=not args.no_cache)
         
         if args.output:
             try:
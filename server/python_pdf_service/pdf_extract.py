@@ -1,7 +1,12 @@
 from flask import Flask, request, jsonify
 import os
+import shutil
+import string
 import tempfile
 import traceback
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
 
 # Import PyMuPDF (fitz) for PDF extraction
 try:
@@ -17,6 +22,103 @@ except ImportError:
     print("pdfminer.six not installed. Please install with: pip install pdfminer.six")
     pdfminer_extract = None
 
+# Plain-text extraction flags: keep whitespace, clip to the page, and join
+# words hyphenated across line breaks. Images and ligature glyphs are skipped.
+TEXT_FLAGS = fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_MEDIABOX_CLIP | fitz.TEXT_DEHYPHENATE
+
+# Flags for the second PyMuPDF pass on PDFs that yielded almost no text: no
+# clipping to the page, ligatures kept, and glyphs without a Unicode mapping
+# emitted by character id (flag only present in newer PyMuPDF versions)
+RECOVERY_TEXT_FLAGS = (fitz.TEXT_PRESERVE_WHITESPACE | fitz.TEXT_PRESERVE_LIGATURES
+                       | getattr(fitz, 'TEXT_CID_FOR_UNKNOWN_UNICODE', 0))
+
+# Below this many non-whitespace characters, extraction is retried (PyMuPDF's
+# recovery pass, then PDFMiner)
+MIN_TEXT_LENGTH = 100
+
+# Whitespace counted out of the text length; \xa0 (no-break space) is common
+# in PDF text
+WHITESPACE_CHARS = tuple(string.whitespace) + ('\xa0',)
+
+def count_text_chars(text):
+    """Count the non-whitespace characters in text without copying it."""
+    return len(text) - sum(text.count(char) for char in WHITESPACE_CHARS)
+
+# Uploads smaller than this are opened from memory; larger ones are streamed
+# to a temp file in COPY_CHUNK_SIZE blocks instead of being held in memory
+MAX_IN_MEMORY_UPLOAD = 8 * 1024 * 1024
+COPY_CHUNK_SIZE = 1 << 20
+
+# PDFs with at least this many pages are split across worker processes.
+# MuPDF is not thread-safe, so each worker process opens its own copy of the
+# document and extracts a contiguous range of pages. Every gunicorn worker has
+# its own pool, so keep it small (PAGE_WORKERS overrides the default).
+PARALLEL_PAGE_THRESHOLD = 4
+MAX_PAGE_WORKERS = int(os.environ.get('PAGE_WORKERS', min(2, os.cpu_count() or 1)))
+
+# Created on first use, so that each (forked) server worker gets its own pool
+_page_pool = None
+
+def _get_page_pool():
+    global _page_pool
+    if _page_pool is None:
+        _page_pool = ProcessPoolExecutor(max_workers=MAX_PAGE_WORKERS)
+    return _page_pool
+
+def open_pdf(source):
+    """Open a PDF from a file path or from the raw bytes of the file."""
+    if isinstance(source, bytes):
+        return fitz.open(stream=source, filetype="pdf")
+    return fitz.open(source)
+
+def _extract_page_range(source, start, stop):
+    """Extract the text of pages [start, stop) in a worker process."""
+    doc = open_pdf(source)
+    try:
+        return [doc[i].get_text("text", flags=TEXT_FLAGS) for i in range(start, stop)]
+    finally:
+        doc.close()
+
+def extract_pages(doc, source):
+    """Extract the text of every page of an open document, in page order.
+    
+    source is the path or bytes the document was opened from, so that
+    worker processes can open their own copy.
+    """
+    page_count = len(doc)
+    if page_count < PARALLEL_PAGE_THRESHOLD or MAX_PAGE_WORKERS < 2:
+        return [page.get_text("text", flags=TEXT_FLAGS) for page in doc]
+    
+    global _page_pool
+    chunk_size = -(-page_count // MAX_PAGE_WORKERS)  # ceiling division
+    try:
+        pool = _get_page_pool()
+        futures = [
+            pool.submit(_extract_page_range, source, start, min(start + chunk_size, page_count))
+            for start in range(0, page_count, chunk_size)
+        ]
+        
+        parts = []
+        for future in futures:
+            parts.extend(future.result())
+        return parts
+    except BrokenProcessPool as e:
+        # A pool process died (e.g. killed or crashed in MuPDF); drop the
+        # pool so the next request starts a fresh one, and finish inline
+        print(f"Page worker pool failed, extracting sequentially: {e}")
+        _page_pool.shutdown(wait=False)
+        _page_pool = None
+        return [page.get_text("text", flags=TEXT_FLAGS) for page in doc]
+
+def extract_pages_recovery(doc):
+    """Re-extract every page from its text blocks with RECOVERY_TEXT_FLAGS."""
+    parts = []
+    for page in doc:
+        blocks = page.get_text("blocks", flags=RECOVERY_TEXT_FLAGS)
+        # Block tuples are (x0, y0, x1, y1, text, block_no, block_type); type 0 is text
+        parts.append("".join(block[4] for block in blocks if block[6] == 0))
+    return parts
+
 app = Flask(__name__)
 
 @app.route('/extract', methods=['POST'])
@@ -32,26 +134,43 @@ def extract_pdf_text():
     if not pdf_file.filename.lower().endswith('.pdf'):
         return jsonify({"error": "File must be a PDF"}), 400
     
-    # Save to temp file
-    temp = tempfile.NamedTemporaryFile(delete=False)
-    temp_path = temp.name
+    temp_path = None
     try:
-        pdf_file.save(temp_path)
-        temp.close()
+        # Keep small uploads in memory; stream larger ones to a temp file
+        content_length = request.content_length or 0
+        if 0 < content_length < MAX_IN_MEMORY_UPLOAD:
+            source = pdf_file.read()
+        else:
+            with tempfile.NamedTemporaryFile(delete=False) as temp:
+                temp_path = temp.name
+                shutil.copyfileobj(pdf_file.stream, temp, COPY_CHUNK_SIZE)
+            source = temp_path
         
         print(f"Processing PDF: {pdf_file.filename}")
         
         # Try PyMuPDF first (faster and usually good)
         text = ""
+        text_length = 0
         try:
-            doc = fitz.open(temp_path)
+            doc = open_pdf(source)
             print(f"PDF has {len(doc)} pages")
             
-            # Extract text with PyMuPDF page by page
-            for page_num, page in enumerate(doc):
-                print(f"Processing page {page_num+1}")
-                page_text = page.get_text()
-                text += page_text + "\n\n"
+            # Extract text with PyMuPDF page by page, joining once at the end
+            parts = extract_pages(doc, source)
+            text = "\n\n".join(parts)
+            # Count non-whitespace characters page by page instead of
+            # stripping a copy of the whole joined document
+            text_length = sum(count_text_chars(part) for part in parts)
+            
+            # Retry with relaxed flags on the already parsed document before
+            # paying for a second full parse with PDFMiner
+            if text_length < MIN_TEXT_LENGTH:
+                print("PyMuPDF extracted minimal text, retrying with recovery flags...")
+                retry_parts = extract_pages_recovery(doc)
+                retry_length = sum(count_text_chars(part) for part in retry_parts)
+                if retry_length > text_length:
+                    text = "\n\n".join(retry_parts)
+                    text_length = retry_length
             
             doc.close()
             print(f"PyMuPDF extracted {len(text)} characters")
@@ -59,12 +178,14 @@ def extract_pdf_text():
             print(f"PyMuPDF extraction failed: {e}")
             traceback.print_exc()
             text = ""
+            text_length = 0
             
         # If PyMuPDF returned little text, try PDFMiner (more thorough but slower)
-        if len(text.strip()) < 100 and pdfminer_extract:
+        if text_length < MIN_TEXT_LENGTH and pdfminer_extract:
             try:
                 print("PyMuPDF extracted minimal text, trying PDFMiner...")
-                text = pdfminer_extract(temp_path)
+                text = pdfminer_extract(BytesIO(source) if isinstance(source, bytes) else source)
+                text_length = count_text_chars(text)
                 print(f"PDFMiner extracted {len(text)} characters")
             except Exception as e:
                 print(f"PDFMiner extraction failed: {e}")
@@ -73,10 +194,7 @@ def extract_pdf_text():
                 if not text:
                     return jsonify({"error": "Failed to extract text with both engines"}), 500
         
-        # Clean up
-        os.unlink(temp_path)
-        
-        if not text or len(text.strip()) < 10:
+        if not text or text_length < 10:
             return jsonify({"error": "No text could be extracted from the PDF"}), 500
             
         return jsonify({"text": text})
@@ -84,14 +202,15 @@ def extract_pdf_text():
     except Exception as e:
         print(f"Error processing PDF: {e}")
         traceback.print_exc()
-        
-        # Clean up the temp file if it exists
-        try:
-            os.unlink(temp_path)
-        except:
-            pass
-            
         return jsonify({"error": str(e)}), 500
+    
+    finally:
+        # Clean up the temp file if one was written
+        if temp_path:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
 
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -99,6 +218,8 @@ def health_check():
     return jsonify({"status": "healthy", "message": "PDF extraction service is running"})
 
 if __name__ == '__main__':
+    # Flask development server, for local debugging only; production runs
+    # under gunicorn via wsgi.py (see start_service.sh)
     port = int(os.environ.get('PORT', 3002))
     host = os.environ.get('HOST', '0.0.0.0')
     debug = os.environ.get('DEBUG', 'False').lower() == 'true'
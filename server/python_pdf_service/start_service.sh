@@ -0,0 +1,4 @@
+#!/bin/sh
+echo "Starting Python PDF Extraction Service..."
+exec gunicorn -w "${WORKERS:-4}" --preload \
+    -b "${HOST:-0.0.0.0}:${PORT:-3002}" wsgi:app
@@ -0,0 +1,13 @@
+"""
+WSGI entry point for running the PDF extraction service under gunicorn.
+
+With --preload, PyMuPDF and pdfminer are imported once in the master process
+and shared by the forked workers. Use the default sync workers: PyMuPDF is not
+thread-safe, so each worker process must handle one request at a time.
+
+    gunicorn -w 4 --preload -b 0.0.0.0:3002 wsgi:app
+"""
+
+from pdf_extract import app
+
+__all__ = ['app']